@@ -0,0 +1,44 @@
+"""JSON helpers that prefer `orjson` but fall back to the stdlib."""
+from __future__ import annotations
+
+import json
+import mmap
+from pathlib import Path
+from typing import Any
+
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from raw bytes (preferred) or text."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_file(path: Path) -> Any:
+    """Parse a JSON file, memory-mapping it so orjson reads the bytes in place."""
+
+    if orjson is None:
+        return json.loads(path.read_bytes())
+    with path.open("rb") as fp:
+        if not path.stat().st_size:  # empty files cannot be mapped; let orjson raise its decode error
+            return orjson.loads(b"")
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                return orjson.loads(view)
+
+
+def dumps(payload: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON, stringifying unknown types."""
+
+    if orjson is not None:
+        return orjson.dumps(payload, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, indent=2, default=str).encode("utf-8")
+
+
+__all__ = ["dumps", "load_file", "loads"]
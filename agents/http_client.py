@@ -1,33 +1,124 @@
 """HTTP helper that prefers `requests` but falls back to urllib."""
 from __future__ import annotations
 
-import json
+import threading
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 from urllib import request as urllib_request
 
+try:  # pragma: no cover - optional dependency
+    import requests  # type: ignore
+    from requests.adapters import HTTPAdapter  # type: ignore
+    from urllib3.util.retry import Retry  # type: ignore
+except Exception:  # pragma: no cover
+    requests = None  # type: ignore
+
+try:  # pragma: no cover - optional dependency
+    import diskcache  # type: ignore
+except Exception:  # pragma: no cover
+    diskcache = None  # type: ignore
+
+from ._json import loads
+
+HTTP_CACHE_DIR = Path("data/http_cache")
+
 
 @dataclass
 class SimpleResponse:
     text: str
     status_code: int
     headers: dict[str, str] | None = None
+    content: bytes | None = None
+
+    def __post_init__(self) -> None:
+        # Header names are case-insensitive; store them lower-cased so lookups are too.
+        if self.headers is not None:
+            self.headers = {key.lower(): value for key, value in self.headers.items()}
 
     def json(self) -> Any:
-        return json.loads(self.text)
+        return loads(self.content if self.content is not None else self.text)
 
     def raise_for_status(self) -> None:
         if not (200 <= self.status_code < 400):
             raise RuntimeError(f"HTTP {self.status_code}")
 
 
+_local = threading.local()
+_cache_lock = threading.Lock()
+_cache: Any = None
+
+
+def get_http_cache() -> Any:
+    """Return the shared on-disk validator cache, or ``None`` when diskcache is missing."""
+
+    global _cache
+    if diskcache is None:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = diskcache.Cache(str(HTTP_CACHE_DIR))
+    return _cache
+
+
+def _build_session() -> Any:
+    session = requests.Session()
+    # One connect retry and no read retries: a dead host costs at most two timeouts.
+    retry = Retry(total=2, connect=1, read=0, backoff_factor=0.2)
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _session() -> Any:
+    """Return a per-thread `requests.Session` so workers reuse keep-alive connections."""
+
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = _local.session = _build_session()
+    return session
+
+
 def http_get(url: str, timeout: int = 20) -> SimpleResponse:
-    try:  # pragma: no cover
-        import requests
+    """GET ``url``, revalidating against cached ETag/Last-Modified validators when possible."""
 
-        response = requests.get(url, timeout=timeout)
-        return SimpleResponse(text=response.text, status_code=response.status_code, headers=dict(response.headers))
-    except Exception:
+    cache = get_http_cache()
+    cached = cache.get(url) if cache is not None else None
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+    if requests is None:  # pragma: no cover - urllib only when requests is not installed
         with urllib_request.urlopen(url, timeout=timeout) as resp:  # type: ignore[arg-type]
-            body = resp.read().decode("utf-8")
-            return SimpleResponse(text=body, status_code=resp.getcode() or 200)
+            raw = resp.read()
+            return SimpleResponse(
+                text=raw.decode("utf-8"), status_code=resp.getcode() or 200, headers=dict(resp.headers), content=raw
+            )
+    response = _session().get(url, timeout=timeout, headers=headers)
+    result = SimpleResponse(
+        text=response.text,
+        status_code=response.status_code,
+        headers=dict(response.headers),
+        content=response.content,
+    )
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if cached and result.status_code == 304:
+        return SimpleResponse(
+            text=cached["text"], status_code=200, headers=cached["headers"], content=cached.get("content")
+        )
+    if cache is not None and result.status_code == 200 and (etag or last_modified):
+        cache.set(
+            url,
+            {
+                "etag": etag,
+                "last_modified": last_modified,
+                "text": result.text,
+                "content": result.content,
+                "headers": result.headers,
+            },
+        )
+    return result
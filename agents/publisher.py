@@ -2,11 +2,12 @@
 from __future__ import annotations
 
 import argparse
-import json
+from functools import lru_cache
 from pathlib import Path
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
+from ._json import loads
 from .logger import logger
 from .models import Digest
 from .theme_engine import ThemeEngine
@@ -24,13 +25,27 @@ def load_digest(target_date: str | None = None) -> Digest:
             raise FileNotFoundError("No digests available")
         digest_path = digests[-1]
     logger.info("Loading digest from %s", digest_path)
-    payload = json.loads(digest_path.read_text())
+    payload = loads(digest_path.read_bytes())
     return Digest(**payload)
 
 
+@lru_cache(maxsize=1)
+def _env() -> Environment:
+    return Environment(
+        loader=FileSystemLoader(TEMPLATES_DIR),
+        autoescape=select_autoescape(["html", "xml"]),
+        auto_reload=False,
+        cache_size=64,
+    )
+
+
+@lru_cache(maxsize=None)
+def _template(name: str):
+    return _env().get_template(name)
+
+
 def build_html(digest: Digest) -> str:
-    env = Environment(loader=FileSystemLoader(TEMPLATES_DIR), autoescape=select_autoescape(["html", "xml"]))
-    template = env.get_template("daily_digest.html.j2")
+    template = _template("daily_digest.html.j2")
     theme = ThemeEngine().get_theme()
     html = template.render(digest=digest.dict(), theme=theme.dict())
     return html
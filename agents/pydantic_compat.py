@@ -16,16 +16,56 @@ except Exception:  # pragma: no cover
     class HttpUrl(str):
         """Very small stand-in for HttpUrl."""
 
-    class BaseModel:
+    _MISSING = object()
+
+    class _ModelMeta(type):
+        """Turns annotated fields into ``__slots__`` so instances carry no ``__dict__``."""
+
+        def __new__(mcs, name, bases, namespace):
+            annotations = namespace.get("__annotations__", {})
+            defaults = {}
+            for field in annotations:
+                if field in namespace:
+                    defaults[field] = namespace.pop(field)
+            namespace["__slots__"] = tuple(annotations)
+            cls = super().__new__(mcs, name, bases, namespace)
+            fields: Dict[str, None] = {}
+            field_defaults: Dict[str, Any] = {}
+            for base in reversed(cls.__mro__[1:]):
+                if isinstance(base, _ModelMeta):
+                    fields.update(dict.fromkeys(base.__fields__))
+                    field_defaults.update(base.__field_defaults__)
+            fields.update(dict.fromkeys(annotations))
+            field_defaults.update(defaults)
+            cls.__fields__ = tuple(fields)
+            cls.__field_defaults__ = field_defaults
+            return cls
+
+    def _to_plain(value: Any) -> Any:
+        if isinstance(value, BaseModel):
+            return value.dict()
+        if isinstance(value, dict):
+            return {key: _to_plain(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [_to_plain(item) for item in value]
+        return value
+
+    class BaseModel(metaclass=_ModelMeta):
         """Tiny subset of the Pydantic interface used in this project."""
 
         def __init__(self, **data: Any) -> None:
-            for key, value in data.items():
-                setattr(self, key, value)
-            self.__dict__.setdefault("__fields__", list(data.keys()))
+            defaults = self.__field_defaults__
+            for field in self.__fields__:
+                value = data.get(field, defaults.get(field, _MISSING))
+                if value is not _MISSING:
+                    setattr(self, field, value)
 
         def dict(self) -> Dict[str, Any]:
-            return {key: getattr(self, key) for key in self.__dict__ if not key.startswith("_")}
+            return {
+                field: _to_plain(getattr(self, field))
+                for field in self.__fields__
+                if hasattr(self, field)
+            }
 
         def json(self, **_: Any) -> str:
             return json.dumps(self.dict(), default=str)
@@ -2,11 +2,17 @@
 from __future__ import annotations
 
 import argparse
+import heapq
+import io
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timezone
+from email.utils import parsedate_to_datetime
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, Iterable, List, Tuple
+from typing import Dict, Iterable, Iterator, List, Tuple
 from urllib.parse import urljoin
+from xml.etree import ElementTree
 
 try:  # pragma: no cover - optional dependency
     import feedparser  # type: ignore
@@ -18,6 +24,11 @@ try:  # pragma: no cover - optional dependency
 except Exception:  # pragma: no cover
     BeautifulSoup = None  # type: ignore
 
+try:  # pragma: no cover - optional dependency, preferred C parser for HTML
+    from selectolax.parser import HTMLParser  # type: ignore
+except Exception:  # pragma: no cover
+    HTMLParser = None  # type: ignore
+
 try:  # pragma: no cover - optional dependency
     from dateutil import parser as dateparser  # type: ignore
 except Exception:  # pragma: no cover
@@ -33,12 +44,41 @@ try:  # pragma: no cover - optional dependency
 except Exception:  # pragma: no cover
     Article = None
 
+from ._json import dumps
 from .http_client import http_get
 from .logger import logger
 from .models import Digest, DigestQuote, SourceMetadata, Story
 from .storage import fetch_sources
 
 DIGESTS_DIR = Path("digests")
+FETCH_WORKERS = 8
+FEED_ENTRY_LIMIT = 10
+# Below this many characters the article text is already a usable summary; skip newspaper's NLP pass.
+NLP_MIN_TEXT_LENGTH = 2000
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+RSS1_NS = "{http://purl.org/rss/1.0/}"
+DC_NS = "{http://purl.org/dc/elements/1.1/}"
+CONTENT_NS = "{http://purl.org/rss/1.0/modules/content/}"
+FEED_ITEM_TAGS = {"item", f"{RSS1_NS}item", f"{ATOM_NS}entry"}
+# Namespace-qualified tag -> entry key for RSS 2.0 (no namespace), RSS 1.0, Atom and Dublin Core.
+# Extension tags such as media:title or itunes:summary are deliberately absent.
+FEED_FIELDS = {
+    "title": "title",
+    "link": "link",
+    "pubDate": "published",
+    "description": "summary",
+    f"{RSS1_NS}title": "title",
+    f"{RSS1_NS}link": "link",
+    f"{RSS1_NS}description": "summary",
+    f"{ATOM_NS}title": "title",
+    f"{ATOM_NS}link": "link",
+    f"{ATOM_NS}published": "published",
+    f"{ATOM_NS}updated": "updated",
+    f"{ATOM_NS}summary": "summary",
+    f"{DC_NS}date": "published",
+}
+# Full-content tags, used as the summary only when an entry has no description/summary.
+FEED_CONTENT_TAGS = {f"{CONTENT_NS}encoded", f"{ATOM_NS}content"}
 DEFAULT_QUOTE = DigestQuote(text="AI shifts economic power when paired with viable business models.", author="Editorial Team")
 
 
@@ -53,60 +93,123 @@ class ReaderAgent:
         stories = self._collect_stories(sources)
         digest = self._build_digest(stories)
         output_path = DIGESTS_DIR / f"digest_{self.target_date.isoformat()}.json"
-        output_path.write_text(digest.json(indent=2, default=str))
+        output_path.write_bytes(dumps(digest.dict()))
         logger.success("Digest written to %s", output_path)
         return output_path
 
     def _collect_stories(self, sources: Iterable[SourceMetadata]) -> List[Story]:
         collected: List[Story] = []
-        for source in sources:
-            try:
-                if source.ingestion_type == "rss":
-                    collected.extend(self._parse_rss(source))
-                else:
-                    collected.extend(self._scrape_html(source))
-            except Exception as exc:  # noqa: BLE001
-                logger.exception("Failed to read %s: %s", source.name, exc)
+        # Fetching is network-bound, so overlap sources; map() keeps source order stable.
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+            for stories in executor.map(self._fetch_one, sources):
+                collected.extend(stories)
         return self._dedupe(collected)
 
+    def _fetch_one(self, source: SourceMetadata) -> List[Story]:
+        try:
+            if source.ingestion_type == "rss":
+                return self._parse_rss(source)
+            return self._scrape_html(source)
+        except Exception as exc:  # noqa: BLE001
+            logger.exception("Failed to read %s: %s", source.name, exc)
+            return []
+
     def _parse_rss(self, source: SourceMetadata) -> List[Story]:
-        if feedparser is None:
-            raise RuntimeError("feedparser is required to parse RSS sources")
         logger.debug("Parsing RSS for %s", source.name)
-        feed = feedparser.parse(source.url)
+        fields = self._source_fields(source)
         stories = []
-        for entry in feed.entries[:10]:
+        for entry in self._fetch_feed_entries(source.url):
             published = self._parse_date(entry.get("published") or entry.get("updated"))
-            summary_html = entry.get("summary", "")
-            summary = (
-                BeautifulSoup(summary_html, "html.parser").get_text()
-                if BeautifulSoup
-                else summary_html
-            )
+            summary = self._html_to_text(entry.get("summary", ""))
             stories.append(
                 self._build_story(
                     title=entry.get("title", "Untitled"),
                     summary=summary,
                     url=entry.get("link"),
                     published=published,
-                    source=source,
+                    source_fields=fields,
                 )
             )
         return stories
 
+    def _fetch_feed_entries(self, url: str) -> List[dict]:
+        response = http_get(url, timeout=20)
+        response.raise_for_status()
+        payload = response.content if response.content is not None else response.text.encode("utf-8")
+        try:
+            entries = self._iter_feed_entries(payload)
+        except ElementTree.ParseError as exc:
+            if feedparser is None:
+                raise RuntimeError("feedparser is required to parse malformed RSS sources") from exc
+            logger.debug("Falling back to feedparser for %s: %s", url, exc)
+        else:
+            # Well-formed feeds in formats we don't stream (Atom 0.3, RSS 0.90, ...) still go to feedparser.
+            if entries or feedparser is None:
+                return entries
+            logger.debug("No RSS/Atom items recognised in %s; falling back to feedparser", url)
+        feed = feedparser.parse(payload)
+        return [
+            {key: entry[key] for key in ("title", "link", "published", "updated", "summary") if key in entry}
+            for entry in feed.entries
+            if entry.get("link")
+        ][:FEED_ENTRY_LIMIT]
+
+    @staticmethod
+    def _iter_feed_entries(payload: bytes) -> List[dict]:
+        """Stream the first ``FEED_ENTRY_LIMIT`` RSS/Atom items without building the whole tree."""
+
+        entries: List[dict] = []
+        for _, elem in ElementTree.iterparse(io.BytesIO(payload), events=("end",)):
+            if elem.tag not in FEED_ITEM_TAGS:
+                continue
+            entry = ReaderAgent._read_feed_entry(elem)
+            elem.clear()
+            if not entry.get("link"):
+                continue
+            entries.append(entry)
+            if len(entries) >= FEED_ENTRY_LIMIT:
+                break
+        return entries
+
+    @staticmethod
+    def _read_feed_entry(elem: ElementTree.Element) -> dict:
+        entry: dict = {}
+        content = None
+        permalink = None
+        for child in elem:
+            if child.tag in FEED_CONTENT_TAGS:
+                content = content or "".join(child.itertext()).strip() or None
+                continue
+            if child.tag == "guid":
+                text = (child.text or "").strip()
+                if child.get("isPermaLink", "true") == "true" and text.startswith("http"):
+                    permalink = permalink or text
+                continue
+            key = FEED_FIELDS.get(child.tag)
+            if key is None or key in entry:
+                continue
+            if key == "link" and child.get("href"):
+                if child.get("rel", "alternate") != "alternate":
+                    continue
+                entry[key] = child.get("href")
+            elif child.text and child.text.strip():
+                entry[key] = child.text.strip()
+        if "link" not in entry and permalink:
+            entry["link"] = permalink
+        if "summary" not in entry and content:
+            entry["summary"] = content
+        return entry
+
     def _scrape_html(self, source: SourceMetadata) -> List[Story]:
         logger.debug("Scraping HTML for %s", source.name)
-        if BeautifulSoup is None:
-            raise RuntimeError("beautifulsoup4 is required to scrape HTML sources")
+        if HTMLParser is None and BeautifulSoup is None:
+            raise RuntimeError("selectolax or beautifulsoup4 is required to scrape HTML sources")
         response = http_get(source.url, timeout=20)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
-        anchors = soup.select("a")
+        fields = self._source_fields(source)
         stories = []
         seen = set()
-        for anchor in anchors:
-            href = anchor.get("href")
-            title = anchor.get_text(strip=True)
+        for href, title in self._iter_anchors(response.text):
             if not href or not title or len(title) < 40:
                 continue
             if href in seen:
@@ -120,32 +223,35 @@ class ReaderAgent:
                     summary=story_summary,
                     url=absolute_url,
                     published=datetime.now(timezone.utc),
-                    source=source,
+                    source_fields=fields,
                 )
             )
             if len(stories) >= 5:
                 break
         return stories
 
-    def _build_story(self, title: str, summary: str, url: str, published: datetime, source: SourceMetadata) -> Story:
-        relevance = min(1.0, (source.credibility_score + source.business_alignment) / 2)
-        topics = source.topics
-        return Story(
-            title=title,
-            summary=summary[:280],
-            url=url,
-            source_id=source.source_id,
-            source_name=source.name,
-            published_at=published,
-            relevance=relevance,
-            topics=topics,
-        )
+    @staticmethod
+    def _source_fields(source: SourceMetadata) -> Dict[str, object]:
+        """Story fields that only depend on the source, computed once per fetch."""
+
+        return {
+            "source_id": source.source_id,
+            "source_name": source.name,
+            "relevance": min(1.0, (source.credibility_score + source.business_alignment) / 2),
+            "topics": source.topics,
+        }
+
+    def _build_story(
+        self, title: str, summary: str, url: str, published: datetime, source_fields: Dict[str, object]
+    ) -> Story:
+        return Story(title=title, summary=summary[:280], url=url, published_at=published, **source_fields)
 
     def _dedupe(self, stories: Iterable[Story]) -> List[Story]:
         seen: Dict[str, Story] = {}
         for story in stories:
-            key = story.url.split("?")[0]
-            if key not in seen or story.relevance > seen[key].relevance:
+            key = story.url.partition("?")[0]
+            previous = seen.get(key)
+            if previous is None or story.relevance > previous.relevance:
                 seen[key] = story
         return list(seen.values())
 
@@ -154,7 +260,7 @@ class ReaderAgent:
         for story in stories:
             for topic in story.topics:
                 topics_map[topic].append(story)
-        timeline = sorted(stories, key=lambda s: s.published_at, reverse=True)[:8]
+        timeline = heapq.nlargest(8, stories, key=attrgetter("published_at"))
         signal_score = min(5, max(1, round(sum(story.relevance for story in stories) / max(len(stories), 1) * 5)))
         digest = Digest(
             date=self.target_date,
@@ -169,31 +275,85 @@ class ReaderAgent:
 
     @staticmethod
     def _parse_date(value: str | None) -> datetime:
-        if not value or dateparser is None:
+        """Parse RFC 2822 / ISO 8601 feed dates with the stdlib, using dateutil only as a fallback."""
+
+        if not value:
+            return datetime.now(timezone.utc)
+        try:
+            parsed = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            pass
+        else:
+            # A "-0000" zone parses as naive but still means UTC, not host-local time.
+            if parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=timezone.utc)
+            return parsed.astimezone(timezone.utc)
+        try:
+            return datetime.fromisoformat(value).astimezone(timezone.utc)
+        except (TypeError, ValueError):
+            pass
+        if dateparser is None:
             return datetime.now(timezone.utc)
         return dateparser.parse(value).astimezone(timezone.utc)
 
+    @staticmethod
+    def _iter_anchors(html: str) -> Iterator[Tuple[str | None, str]]:
+        """Yield ``(href, text)`` for every anchor, preferring selectolax over bs4."""
+
+        if HTMLParser is not None:
+            for node in HTMLParser(html).css("a"):
+                yield node.attributes.get("href"), node.text(strip=True)
+            return
+        for anchor in BeautifulSoup(html, "html.parser").select("a"):
+            yield anchor.get("href"), anchor.get_text(strip=True)
+
+    @staticmethod
+    def _html_to_text(html: str, separator: str = "", strip: bool = False) -> str:
+        if HTMLParser is not None:
+            return HTMLParser(html).text(separator=separator, strip=strip)
+        if BeautifulSoup is not None:
+            return BeautifulSoup(html, "html.parser").get_text(separator, strip=strip)
+        return html
+
     @staticmethod
     def _resolve_url(base: str, href: str) -> str:
         return href if href.startswith("http") else urljoin(base, href)
 
     def _summarize_article(self, url: str, fallback: str) -> str:
-        summary = self._try_newspaper_summary(url)
-        if not summary:
-            summary = self._try_readability_summary(url)
+        html = self._fetch_article_html(url) if (Article is not None or Document is not None) else None
+        summary = None
+        if html:
+            summary = self._try_newspaper_summary(url, html)
+            if not summary:
+                summary = self._try_readability_summary(url, html)
         if not summary:
             summary = fallback
         return summary[:280]
 
-    def _try_newspaper_summary(self, url: str) -> str | None:
+    def _fetch_article_html(self, url: str) -> str | None:
+        """Download an article once so both summarizers can share the body."""
+
+        try:
+            response = http_get(url, timeout=20)
+            response.raise_for_status()
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("Article download failed for %s: %s", url, exc)
+            return None
+        content_type = (response.headers or {}).get("content-type", "").lower()
+        if content_type and "html" not in content_type:
+            logger.debug("Skipping summary for %s with content type %s", url, content_type)
+            return None
+        return response.text
+
+    def _try_newspaper_summary(self, url: str, html: str) -> str | None:
         if Article is None:
             return None
         try:
             article = Article(url)
-            article.download()
+            article.download(input_html=html)
             article.parse()
             summary = article.summary
-            if not summary:
+            if not summary and len(article.text) > NLP_MIN_TEXT_LENGTH:
                 try:
                     article.nlp()  # type: ignore[attr-defined]
                     summary = article.summary
@@ -206,18 +366,12 @@ class ReaderAgent:
             logger.debug("newspaper3k summary failed for %s: %s", url, exc)
             return None
 
-    def _try_readability_summary(self, url: str) -> str | None:
+    def _try_readability_summary(self, url: str, html: str) -> str | None:
         if Document is None:
             return None
         try:
-            response = http_get(url, timeout=20)
-            response.raise_for_status()
-            document = Document(response.text)
-            summary_html = document.summary(html_partial=True)
-            if BeautifulSoup:
-                summary_text = BeautifulSoup(summary_html, "html.parser").get_text(" ", strip=True)
-            else:
-                summary_text = summary_html
+            document = Document(html)
+            summary_text = self._html_to_text(document.summary(html_partial=True), separator=" ", strip=True)
             return summary_text or None
         except Exception as exc:  # noqa: BLE001
             logger.debug("Readability summary failed for %s: %s", url, exc)
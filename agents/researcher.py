@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import argparse
 import json
+import re
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, Sequence
@@ -58,6 +59,8 @@ DEFAULT_SOURCES = [
     },
 ]
 
+_NON_SLUG_CHAR = re.compile(r"\W")
+SCORE_FIELDS = ("credibility_score", "visitor_score", "business_alignment")
 FEEDBACK_NOTES = Path("docs/FEEDBACK.md")
 
 
@@ -85,8 +88,7 @@ class ResearcherAgent:
         logger.info("Normalizing %d baseline sources", len(DEFAULT_SOURCES))
         normalized = []
         for payload in DEFAULT_SOURCES:
-            relevance = (payload["credibility_score"] + payload["visitor_score"] + payload["business_alignment"]) / 3
-            if relevance < self.minimum_score:
+            if sum(payload[field] for field in SCORE_FIELDS) / len(SCORE_FIELDS) < self.minimum_score:
                 logger.warning("Skipping %s due to low aggregate score", payload["name"])
                 continue
             normalized.append(SourceMetadata(**payload))
@@ -116,7 +118,7 @@ class ResearcherAgent:
 
     @staticmethod
     def _slugify_name(name: str) -> str:
-        return "".join(ch.lower() if ch.isalnum() else "_" for ch in name).strip("_") or "source"
+        return _NON_SLUG_CHAR.sub("_", name).lower().strip("_") or "source"
 
     def request_feedback(self) -> None:
         data = load_feedback()
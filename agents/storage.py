@@ -2,12 +2,15 @@
 from __future__ import annotations
 
 import argparse
-import json
 import sqlite3
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable, List, Sequence
+from typing import Dict, Iterable, Iterator, List, Sequence
 
+from ._json import dumps, load_file, loads
 from .models import FeedbackResponse, SourceMetadata
 
 DB_PATH = Path("data/sources.db")
@@ -15,67 +18,143 @@ FEEDBACK_PATH = Path("data/feedback.json")
 CATALOG_PATH = Path("data/source_catalog.json")
 
 
+UPSERT_SOURCE_SQL = """
+    INSERT INTO sources (
+        source_id, name, url, ingestion_type, credibility_score,
+        cadence, visitor_score, business_alignment, last_checked
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(source_id) DO UPDATE SET
+        name=excluded.name,
+        url=excluded.url,
+        ingestion_type=excluded.ingestion_type,
+        credibility_score=excluded.credibility_score,
+        cadence=excluded.cadence,
+        visitor_score=excluded.visitor_score,
+        business_alignment=excluded.business_alignment,
+        last_checked=excluded.last_checked
+"""
+
+SCHEMA_SQL = """
+    CREATE TABLE IF NOT EXISTS sources (
+        source_id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        url TEXT NOT NULL,
+        ingestion_type TEXT NOT NULL,
+        credibility_score REAL,
+        cadence TEXT,
+        visitor_score REAL,
+        business_alignment REAL,
+        last_checked TEXT
+    );
+    CREATE TABLE IF NOT EXISTS source_topics (
+        source_id TEXT NOT NULL,
+        topic TEXT NOT NULL,
+        position INTEGER NOT NULL,
+        PRIMARY KEY (source_id, position)
+    );
+    CREATE INDEX IF NOT EXISTS idx_source_topics_topic ON source_topics (topic);
+"""
+
+# Databases created before source_topics existed kept topics as a JSON column. The column is left in
+# place (DROP COLUMN needs SQLite 3.35+) and cleared once backfilled, so stale lists never come back.
+MIGRATE_LEGACY_TOPICS_SQL = """
+    INSERT OR IGNORE INTO source_topics (source_id, topic, position)
+    SELECT sources.source_id, topic.value, topic.key
+    FROM sources, json_each(sources.topics) AS topic
+    WHERE sources.topics IS NOT NULL AND json_valid(sources.topics)
+"""
+CLEAR_LEGACY_TOPICS_SQL = "UPDATE sources SET topics = NULL WHERE topics IS NOT NULL"
+
+INSERT_TOPIC_SQL = "INSERT INTO source_topics (source_id, topic, position) VALUES (?, ?, ?)"
+
+SELECT_SOURCES_SQL = """
+    SELECT
+        source_id, name, url, ingestion_type, credibility_score,
+        cadence, visitor_score, business_alignment, last_checked
+    FROM sources
+"""
+SELECT_TOPICS_SQL = "SELECT source_id, topic FROM source_topics ORDER BY source_id, position"
+
+# One long-lived connection per database file, shared by every storage helper.
+_CONNECTIONS: Dict[Path, sqlite3.Connection] = {}
+_CONN_LOCK = threading.RLock()
+
+
+def _connect() -> sqlite3.Connection:
+    with _CONN_LOCK:
+        conn = _CONNECTIONS.get(DB_PATH)
+        if conn is None:
+            DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(DB_PATH, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.executescript(SCHEMA_SQL)
+            _CONNECTIONS[DB_PATH] = conn
+            try:
+                _migrate_legacy_topics(conn)
+            except BaseException:
+                # Forget the half-initialised connection so the next call retries the migration.
+                del _CONNECTIONS[DB_PATH]
+                conn.close()
+                raise
+        return conn
+
+
+def _migrate_legacy_topics(conn: sqlite3.Connection) -> None:
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(sources)")}
+    if "topics" not in columns:
+        return
+    with _transaction() as tx:
+        tx.execute(MIGRATE_LEGACY_TOPICS_SQL)
+        tx.execute(CLEAR_LEGACY_TOPICS_SQL)
+
+
+@contextmanager
+def _transaction() -> Iterator[sqlite3.Connection]:
+    with _CONN_LOCK:
+        conn = _connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+
 def ensure_schema() -> None:
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with sqlite3.connect(DB_PATH) as conn:
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS sources (
-                source_id TEXT PRIMARY KEY,
-                name TEXT NOT NULL,
-                url TEXT NOT NULL,
-                ingestion_type TEXT NOT NULL,
-                credibility_score REAL,
-                topics TEXT,
-                cadence TEXT,
-                visitor_score REAL,
-                business_alignment REAL,
-                last_checked TEXT
-            )
-            """
-        )
-        conn.commit()
+    _connect()
+
+
+def _source_row(src: SourceMetadata) -> tuple:
+    last_checked = src.last_checked
+    if isinstance(last_checked, str):  # pragma: no cover - defensive for raw payloads
+        last_checked = datetime.fromisoformat(last_checked)
+    return (
+        src.source_id,
+        src.name,
+        src.url,
+        src.ingestion_type,
+        src.credibility_score,
+        src.cadence,
+        src.visitor_score,
+        src.business_alignment,
+        last_checked.isoformat() if last_checked else None,
+    )
 
 
 def upsert_sources(sources: Iterable[SourceMetadata]) -> None:
-    ensure_schema()
-    with sqlite3.connect(DB_PATH) as conn:
-        for src in sources:
-            last_checked = src.last_checked
-            if isinstance(last_checked, str):  # pragma: no cover - defensive for raw payloads
-                last_checked = datetime.fromisoformat(last_checked)
-            conn.execute(
-                """
-                INSERT INTO sources (
-                    source_id, name, url, ingestion_type, credibility_score, topics,
-                    cadence, visitor_score, business_alignment, last_checked
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(source_id) DO UPDATE SET
-                    name=excluded.name,
-                    url=excluded.url,
-                    ingestion_type=excluded.ingestion_type,
-                    credibility_score=excluded.credibility_score,
-                    topics=excluded.topics,
-                    cadence=excluded.cadence,
-                    visitor_score=excluded.visitor_score,
-                    business_alignment=excluded.business_alignment,
-                    last_checked=excluded.last_checked
-                """,
-                (
-                    src.source_id,
-                    src.name,
-                    src.url,
-                    src.ingestion_type,
-                    src.credibility_score,
-                    json.dumps(src.topics),
-                    src.cadence,
-                    src.visitor_score,
-                    src.business_alignment,
-                    last_checked.isoformat() if last_checked else None,
-                ),
-            )
-        conn.commit()
-    save_catalog(list(sources))
+    sources = list(sources)
+    rows = [_source_row(src) for src in sources]
+    topic_rows = [
+        (src.source_id, topic, position) for src in sources for position, topic in enumerate(src.topics or [])
+    ]
+    with _transaction() as conn:
+        conn.executemany(UPSERT_SOURCE_SQL, rows)
+        conn.executemany("DELETE FROM source_topics WHERE source_id = ?", [(src.source_id,) for src in sources])
+        conn.executemany(INSERT_TOPIC_SQL, topic_rows)
+    save_catalog(sources)
 
 
 def _serialize_sources(payload: Sequence[dict]) -> List[SourceMetadata]:
@@ -86,11 +165,13 @@ def _serialize_sources(payload: Sequence[dict]) -> List[SourceMetadata]:
 
 
 def fetch_sources() -> List[SourceMetadata]:
-    ensure_schema()
-    with sqlite3.connect(DB_PATH) as conn:
-        rows = conn.execute(
-            "SELECT source_id, name, url, ingestion_type, credibility_score, topics, cadence, visitor_score, business_alignment, last_checked FROM sources"
-        ).fetchall()
+    with _CONN_LOCK:
+        conn = _connect()
+        rows = conn.execute(SELECT_SOURCES_SQL).fetchall()
+        topic_rows = conn.execute(SELECT_TOPICS_SQL).fetchall()
+    topics: Dict[str, List[str]] = defaultdict(list)
+    for source_id, topic in topic_rows:
+        topics[source_id].append(topic)
     sources: List[SourceMetadata] = []
     for row in rows:
         sources.append(
@@ -100,25 +181,22 @@ def fetch_sources() -> List[SourceMetadata]:
                 url=row[2],
                 ingestion_type=row[3],
                 credibility_score=row[4],
-                topics=json.loads(row[5] or "[]"),
-                cadence=row[6],
-                visitor_score=row[7],
-                business_alignment=row[8],
-                last_checked=datetime.fromisoformat(row[9]) if row[9] else None,
+                topics=topics.get(row[0], []),
+                cadence=row[5],
+                visitor_score=row[6],
+                business_alignment=row[7],
+                last_checked=datetime.fromisoformat(row[8]) if row[8] else None,
             )
         )
     if not sources and CATALOG_PATH.exists():
-        with CATALOG_PATH.open("r", encoding="utf-8") as fp:
-            data = json.load(fp)
-        return _serialize_sources(data)
+        return _serialize_sources(load_file(CATALOG_PATH))
     return sources
 
 
 def save_catalog(sources: List[SourceMetadata]) -> None:
     CATALOG_PATH.parent.mkdir(parents=True, exist_ok=True)
     payload = [src.dict() for src in sources]
-    with CATALOG_PATH.open("w", encoding="utf-8") as fp:
-        json.dump(payload, fp, indent=2, default=str)
+    CATALOG_PATH.write_bytes(dumps(payload))
 
 
 def seed_db_from_catalog(catalog_path: Path | None = None) -> List[SourceMetadata]:
@@ -127,9 +205,7 @@ def seed_db_from_catalog(catalog_path: Path | None = None) -> List[SourceMetadat
     path = catalog_path or CATALOG_PATH
     if not path.exists():  # pragma: no cover - sanity guard
         raise FileNotFoundError(f"Catalog file {path} is missing")
-    with path.open("r", encoding="utf-8") as fp:
-        payload = json.load(fp)
-    sources = _serialize_sources(payload)
+    sources = _serialize_sources(load_file(path))
     upsert_sources(sources)
     return sources
 
@@ -141,27 +217,27 @@ def export_catalog_from_db(target_path: Path | None = None) -> List[SourceMetada
     path = target_path or CATALOG_PATH
     payload = [src.dict() for src in sources]
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as fp:
-        json.dump(payload, fp, indent=2, default=str)
+    path.write_bytes(dumps(payload))
     return sources
 
 
 def load_feedback() -> dict:
     FEEDBACK_PATH.parent.mkdir(parents=True, exist_ok=True)
     if not FEEDBACK_PATH.exists():
-        FEEDBACK_PATH.write_text(json.dumps({"last_request_iso": None, "requests": [], "responses": []}, indent=2))
-    with FEEDBACK_PATH.open("r", encoding="utf-8") as fp:
-        return json.load(fp)
+        FEEDBACK_PATH.write_bytes(dumps({"last_request_iso": None, "requests": [], "responses": []}))
+    return loads(FEEDBACK_PATH.read_bytes())
 
 
 def save_feedback(payload: dict) -> None:
-    with FEEDBACK_PATH.open("w", encoding="utf-8") as fp:
-        json.dump(payload, fp, indent=2, default=str)
+    FEEDBACK_PATH.write_bytes(dumps(payload))
 
 
 def consume_feedback_responses() -> List[FeedbackResponse]:
     data = load_feedback()
-    responses = [FeedbackResponse(**resp) for resp in data.get("responses", [])]
+    raw_responses = data.get("responses")
+    if not raw_responses:
+        return []
+    responses = [FeedbackResponse(**resp) for resp in raw_responses]
     data["responses"] = []
     save_feedback(data)
     return responses
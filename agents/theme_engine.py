@@ -1,11 +1,13 @@
 """Weather-aware theming utilities."""
 from __future__ import annotations
 
-import json
-from datetime import datetime
+import re
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict
 
+from ._json import loads
 from .http_client import http_get
 from .logger import logger
 from .models import ThemeContext
@@ -15,59 +17,112 @@ WEATHER_STUB = Path("data/weather_stub.json")
 WTTR_URL = "https://wttr.in/Helsinki?format=j1"
 
 
+@lru_cache(maxsize=1)
+def _load_palettes() -> Dict[str, Dict[str, Dict[str, str]]]:
+    return loads(PALETTES_PATH.read_bytes())
+
+
+@lru_cache(maxsize=1)
+def _load_weather_stub() -> Dict[str, Any]:
+    return loads(WEATHER_STUB.read_bytes())
+
+
+@lru_cache(maxsize=1)
+def _cached_theme(hour_bucket: int) -> ThemeContext:
+    """Theme for one epoch hour; weather moves slowly, so flows share a single fetch per hour."""
+
+    return ThemeEngine()._build_theme()
+
+
 class ThemeEngine:
+    # Indexed by month number; slot 0 is unused.
+    _SEASONS = (
+        None,
+        "winter", "winter",
+        "spring", "spring", "spring",
+        "summer", "summer", "summer",
+        "autumn", "autumn", "autumn",
+        "winter",
+    )
+    _DESCRIPTORS = {
+        "sunny": "Bright Signals",
+        "cloudy": "Steady Signals",
+        "snow": "Crystal Signals",
+        "rain": "Resilient Signals",
+        "wind": "Shifting Signals",
+    }
+    _DEFAULT_TITLE = "Daily Signals"
+    # Conditions detected in the wttr.in description, highest priority first.
+    _CONDITION_PRIORITY = ("snow", "rain", "wind")
+    _CONDITION_RE = re.compile("|".join(_CONDITION_PRIORITY))
+    _DEFAULT_CONDITION = "cloudy"
+    # Pre-titled forms of the fixed season/condition vocabulary used in subtitles and summaries.
+    _DISPLAY_NAMES = {
+        word: word.title() for word in ("winter", "spring", "summer", "autumn", *_DESCRIPTORS)
+    }
+
     def __init__(self) -> None:
-        self.palettes = json.loads(PALETTES_PATH.read_text())
+        self.palettes = _load_palettes()
 
     def get_theme(self) -> ThemeContext:
+        return _cached_theme(int(time.time() // 3600))
+
+    def _build_theme(self) -> ThemeContext:
         weather = self._fetch_weather()
         palette = self._select_palette(weather)
         title = self._compose_title(weather)
-        subtitle = f"Signals tuned for Helsinki • {weather['season'].title()} {int(weather['temperature_c'])}°C"
-        return ThemeContext(title=title, subtitle=subtitle, palette=palette, weather={"summary": self._format_weather(weather)})
+        location, season, condition, temperature = (
+            weather["location"],
+            weather["season"],
+            weather["condition"],
+            weather["temperature_c"],
+        )
+        subtitle = f"Signals tuned for Helsinki • {self._display_name(season)} {int(temperature)}°C"
+        summary = self._format_weather(location, condition, temperature)
+        return ThemeContext(title=title, subtitle=subtitle, palette=palette, weather={"summary": summary})
 
     def _fetch_weather(self) -> Dict[str, str]:
         try:
             response = http_get(WTTR_URL, timeout=10)
             response.raise_for_status()
-            payload = response.json()
-            condition = payload["current_condition"][0]["weatherDesc"][0]["value"].lower()
-            temp = float(payload["current_condition"][0]["temp_C"])
-            season = self._season_from_month(datetime.utcnow().month)
+            current = response.json()["current_condition"][0]
+            condition = current["weatherDesc"][0]["value"].lower()
+            temp = float(current["temp_C"])
+            season = self._season_from_month(time.gmtime().tm_mon)
             return {
                 "location": "Helsinki",
                 "season": season,
-                "condition": "snow" if "snow" in condition else ("rain" if "rain" in condition else "cloudy"),
+                "condition": self._classify_condition(condition),
                 "temperature_c": temp,
             }
         except Exception as exc:  # noqa: BLE001
             logger.warning("Weather fetch failed, using stub: %s", exc)
-            return json.loads(WEATHER_STUB.read_text())
+            return dict(_load_weather_stub())
 
     def _select_palette(self, weather: Dict[str, str]) -> Dict[str, str]:
         season_palettes = self.palettes.get(weather["season"], {})
         palette = season_palettes.get(weather["condition"]) or next(iter(season_palettes.values()))
         return palette
 
+    @classmethod
+    def _classify_condition(cls, description: str) -> str:
+        found = set(cls._CONDITION_RE.findall(description))
+        for condition in cls._CONDITION_PRIORITY:
+            if condition in found:
+                return condition
+        return cls._DEFAULT_CONDITION
+
     def _compose_title(self, weather: Dict[str, str]) -> str:
-        descriptors = {
-            "sunny": "Bright Signals",
-            "cloudy": "Steady Signals",
-            "snow": "Crystal Signals",
-            "rain": "Resilient Signals",
-            "wind": "Shifting Signals",
-        }
-        return descriptors.get(weather["condition"], "Daily Signals")
-
-    def _format_weather(self, weather: Dict[str, str]) -> str:
-        return f"{weather['location']} • {weather['condition'].title()} • {weather['temperature_c']}°C"
-
-    @staticmethod
-    def _season_from_month(month: int) -> str:
-        if month in (12, 1, 2):
-            return "winter"
-        if month in (3, 4, 5):
-            return "spring"
-        if month in (6, 7, 8):
-            return "summer"
-        return "autumn"
+        return self._DESCRIPTORS.get(weather["condition"], self._DEFAULT_TITLE)
+
+    @classmethod
+    def _format_weather(cls, location: str, condition: str, temperature: float) -> str:
+        return f"{location} • {cls._display_name(condition)} • {temperature}°C"
+
+    @classmethod
+    def _display_name(cls, word: str) -> str:
+        return cls._DISPLAY_NAMES.get(word) or word.title()
+
+    @classmethod
+    def _season_from_month(cls, month: int) -> str:
+        return cls._SEASONS[month]
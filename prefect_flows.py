@@ -1,8 +1,7 @@
 """Prefect flows for orchestrating the agents."""
 from __future__ import annotations
 
-from prefect import flow
-from prefect.deployments import Deployment
+from prefect import flow, serve
 from prefect.server.schemas.schedules import CronSchedule
 
 from agents.publisher import load_digest, publish
@@ -30,18 +29,18 @@ def publisher_flow() -> str:
 
 if __name__ == "__main__":
     tz = "Europe/Helsinki"
-    Deployment.build_from_flow(
-        flow=researcher_flow,
-        name="researcher-weekly",
-        schedule=(CronSchedule(cron="0 8 * * MON", timezone=tz)),
-    ).apply()
-    Deployment.build_from_flow(
-        flow=reader_flow,
-        name="reader-daily",
-        schedule=(CronSchedule(cron="0 8 * * 2-5", timezone=tz)),
-    ).apply()
-    Deployment.build_from_flow(
-        flow=publisher_flow,
-        name="publisher-daily",
-        schedule=(CronSchedule(cron="5 8 * * 2-5", timezone=tz)),
-    ).apply()
+    # serve() registers every schedule from this one long-running process; no separate worker needed.
+    serve(
+        researcher_flow.to_deployment(
+            name="researcher-weekly",
+            schedule=CronSchedule(cron="0 8 * * MON", timezone=tz),
+        ),
+        reader_flow.to_deployment(
+            name="reader-daily",
+            schedule=CronSchedule(cron="0 8 * * 2-5", timezone=tz),
+        ),
+        publisher_flow.to_deployment(
+            name="publisher-daily",
+            schedule=CronSchedule(cron="5 8 * * 2-5", timezone=tz),
+        ),
+    )
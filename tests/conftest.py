@@ -0,0 +1,24 @@
+from datetime import date
+
+import pytest
+
+from agents.reader import ReaderAgent
+from agents.researcher import ResearcherAgent
+from agents.theme_engine import ThemeEngine
+
+
+# Agents are stateless between calls, so one instance per session (per xdist worker) is enough.
+# Tests still patch behaviour through the function-scoped ``monkeypatch`` fixture.
+@pytest.fixture(scope="session")
+def reader_agent():
+    return ReaderAgent(target_date=date.today())
+
+
+@pytest.fixture(scope="session")
+def researcher_agent():
+    return ResearcherAgent()
+
+
+@pytest.fixture(scope="session")
+def theme_engine():
+    return ThemeEngine()
@@ -0,0 +1,63 @@
+import pytest
+
+from agents import http_client
+
+
+class FakeCache(dict):
+    def set(self, key, value):
+        self[key] = value
+
+
+class FakeResponse:
+    def __init__(self, status_code, text="", headers=None):
+        self.status_code = status_code
+        self.text = text
+        self.content = text.encode("utf-8")
+        self.headers = headers or {}
+
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+
+    def get(self, url, timeout, headers):
+        self.sent_headers.append(headers)
+        return self.responses.pop(0)
+
+
+def test_http_get_revalidates_with_etag(monkeypatch):
+    cache = FakeCache()
+    session = FakeSession(
+        [
+            FakeResponse(200, "fresh body", {"ETag": '"v1"'}),
+            FakeResponse(304),
+        ]
+    )
+    monkeypatch.setattr(http_client, "requests", object())
+    monkeypatch.setattr(http_client, "get_http_cache", lambda: cache)
+    monkeypatch.setattr(http_client, "_session", lambda: session)
+
+    first = http_client.http_get("https://example.com/feed")
+    second = http_client.http_get("https://example.com/feed")
+
+    assert first.text == second.text == "fresh body"
+    assert second.status_code == 200
+    assert session.sent_headers == [{}, {"If-None-Match": '"v1"'}]
+
+
+def test_http_get_does_not_retry_failed_requests_through_urllib(monkeypatch):
+    class FailingSession:
+        def get(self, url, timeout, headers):
+            raise TimeoutError("read timed out")
+
+    def fail_urlopen(*_, **__):
+        raise AssertionError("urllib fallback must only run without requests")
+
+    monkeypatch.setattr(http_client, "requests", object())
+    monkeypatch.setattr(http_client, "get_http_cache", lambda: None)
+    monkeypatch.setattr(http_client, "_session", lambda: FailingSession())
+    monkeypatch.setattr(http_client.urllib_request, "urlopen", fail_urlopen)
+
+    with pytest.raises(TimeoutError):
+        http_client.http_get("https://example.com/slow")
@@ -1,44 +1,206 @@
-from datetime import date
+import json
+import time
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
 
+from agents.http_client import SimpleResponse
 from agents.reader import ReaderAgent
 
 
-def test_summarize_prefers_newspaper(monkeypatch):
-    agent = ReaderAgent(target_date=date.today())
-
-    def fake_newspaper(self, url):
+def test_summarize_prefers_newspaper(monkeypatch, reader_agent):
+    def fake_newspaper(self, url, html):
         return "newspaper summary"
 
-    def fake_readability(self, url):
+    def fake_readability(self, url, html):
         return "readability summary"
 
+    monkeypatch.setattr("agents.reader.Article", object(), raising=False)
+    monkeypatch.setattr(ReaderAgent, "_fetch_article_html", lambda self, url: "<html></html>")
     monkeypatch.setattr(ReaderAgent, "_try_newspaper_summary", fake_newspaper)
     monkeypatch.setattr(ReaderAgent, "_try_readability_summary", fake_readability)
 
-    summary = agent._summarize_article("https://example.com", "fallback")
+    summary = reader_agent._summarize_article("https://example.com", "fallback")
     assert summary == "newspaper summary"
 
 
-def test_summarize_falls_back_to_input(monkeypatch):
-    agent = ReaderAgent(target_date=date.today())
-
-    monkeypatch.setattr(ReaderAgent, "_try_newspaper_summary", lambda self, url: None)
-    monkeypatch.setattr(ReaderAgent, "_try_readability_summary", lambda self, url: None)
+def test_summarize_falls_back_to_input(monkeypatch, reader_agent):
+    monkeypatch.setattr("agents.reader.Article", object(), raising=False)
+    monkeypatch.setattr(ReaderAgent, "_fetch_article_html", lambda self, url: "<html></html>")
+    monkeypatch.setattr(ReaderAgent, "_try_newspaper_summary", lambda self, url, html: None)
+    monkeypatch.setattr(ReaderAgent, "_try_readability_summary", lambda self, url, html: None)
 
     fallback = "fallback text" * 30
-    summary = agent._summarize_article("https://example.com", fallback)
+    summary = reader_agent._summarize_article("https://example.com", fallback)
     assert summary.startswith("fallback text")
     assert len(summary) <= 280
 
 
-def test_summarize_handles_missing_optional_dependencies(monkeypatch):
-    agent = ReaderAgent(target_date=date.today())
-
+def test_summarize_handles_missing_optional_dependencies(monkeypatch, reader_agent):
     # Simulate optional wheels not being installed
     monkeypatch.setattr("agents.reader.Article", None, raising=False)
     monkeypatch.setattr("agents.reader.Document", None, raising=False)
-    monkeypatch.setattr(ReaderAgent, "_try_newspaper_summary", lambda self, url: None)
-    monkeypatch.setattr(ReaderAgent, "_try_readability_summary", lambda self, url: None)
 
-    summary = agent._summarize_article("https://example.com", "fallback summary")
+    def fail_download(self, url):
+        raise AssertionError("article HTML should not be fetched without summarizers")
+
+    monkeypatch.setattr(ReaderAgent, "_fetch_article_html", fail_download)
+
+    summary = reader_agent._summarize_article("https://example.com", "fallback summary")
     assert summary.startswith("fallback summary")
+
+
+def test_collect_stories_skips_failing_sources(monkeypatch, reader_agent):
+    def fake_rss(self, source):
+        if source.name == "broken":
+            raise RuntimeError("feed down")
+        return [source.name]
+
+    monkeypatch.setattr(ReaderAgent, "_parse_rss", fake_rss)
+    monkeypatch.setattr(ReaderAgent, "_dedupe", lambda self, stories: list(stories))
+
+    sources = [SimpleNamespace(name=name, ingestion_type="rss") for name in ("first", "broken", "second")]
+    assert reader_agent._collect_stories(sources) == ["first", "second"]
+
+
+def test_iter_anchors_extracts_href_and_text():
+    html = '<div><a href="/story"> Markets <b>rally</b></a><a>no link</a></div>'
+    anchors = list(ReaderAgent._iter_anchors(html))
+    assert anchors[0] == ("/story", "Marketsrally")
+    assert anchors[1][0] is None
+
+
+def test_dedupe_keeps_most_relevant_story_per_url(reader_agent):
+    stories = [
+        SimpleNamespace(url="https://example.com/a?utm=1", relevance=0.4),
+        SimpleNamespace(url="https://example.com/a", relevance=0.9),
+        SimpleNamespace(url="https://example.com/b", relevance=0.5),
+        SimpleNamespace(url="https://example.com/a?ref=2", relevance=0.9),
+    ]
+    deduped = reader_agent._dedupe(stories)
+    assert [story.relevance for story in deduped] == [0.9, 0.5]
+    assert deduped[0].url == "https://example.com/a"
+
+
+def test_parse_date_handles_rfc2822_and_iso8601():
+    rfc = ReaderAgent._parse_date("Tue, 14 May 2024 08:30:00 +0200")
+    iso = ReaderAgent._parse_date("2024-05-14T06:30:00Z")
+    assert rfc == iso == datetime(2024, 5, 14, 6, 30, tzinfo=timezone.utc)
+
+
+def test_parse_date_treats_minus_zero_zone_as_utc(monkeypatch):
+    monkeypatch.setenv("TZ", "Europe/Helsinki")
+    time.tzset()
+    try:
+        parsed = ReaderAgent._parse_date("Tue, 14 May 2024 08:30:00 -0000")
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+    assert parsed == datetime(2024, 5, 14, 8, 30, tzinfo=timezone.utc)
+
+
+def test_iter_feed_entries_reads_rss_and_atom():
+    rss = b"""<?xml version="1.0"?>
+    <rss version="2.0"><channel><title>Feed</title>
+      <item><title>First</title><link>https://example.com/1</link>
+        <pubDate>Tue, 14 May 2024 08:30:00 +0000</pubDate><description>&lt;p&gt;Body&lt;/p&gt;</description></item>
+      <item><title>Second</title><link>https://example.com/2</link></item>
+    </channel></rss>"""
+    atom = b"""<feed xmlns="http://www.w3.org/2005/Atom">
+      <entry><title>Atom story</title><link rel="self" href="https://example.com/self"/>
+        <link href="https://example.com/atom"/><updated>2024-05-14T08:30:00Z</updated></entry>
+    </feed>"""
+    rss_entries = ReaderAgent._iter_feed_entries(rss)
+    assert [entry["title"] for entry in rss_entries] == ["First", "Second"]
+    assert rss_entries[0]["summary"] == "<p>Body</p>"
+    assert ReaderAgent._iter_feed_entries(atom) == [
+        {"title": "Atom story", "link": "https://example.com/atom", "updated": "2024-05-14T08:30:00Z"}
+    ]
+
+
+def test_iter_feed_entries_stops_at_limit():
+    items = "".join(
+        f"<item><title>Story {idx}</title><link>https://example.com/{idx}</link></item>" for idx in range(25)
+    )
+    payload = f"<rss><channel>{items}</channel></rss>".encode()
+    assert len(ReaderAgent._iter_feed_entries(payload)) == 10
+
+
+def test_iter_feed_entries_uses_permalink_guid_and_skips_linkless_items():
+    payload = b"""<rss version="2.0"><channel>
+      <item><title>Guid only</title><guid isPermaLink="true">https://example.com/guid</guid></item>
+      <item><title>Opaque guid</title><guid isPermaLink="false">tag:example.com,2024:1</guid></item>
+      <item><title>Nothing</title></item>
+    </channel></rss>"""
+    entries = ReaderAgent._iter_feed_entries(payload)
+    assert entries == [{"title": "Guid only", "link": "https://example.com/guid"}]
+
+
+def test_iter_feed_entries_ignores_extension_namespaces():
+    payload = b"""<rss version="2.0" xmlns:media="http://search.yahoo.com/mrss/"
+        xmlns:itunes="http://www.itunes.com/dtds/podcast-1.0.dtd"><channel>
+      <item><media:title>M</media:title><title>T</title><link>https://example.com/t</link>
+        <itunes:summary>Podcast blurb</itunes:summary><description>Real summary</description></item>
+    </channel></rss>"""
+    entry = ReaderAgent._iter_feed_entries(payload)[0]
+    assert entry["title"] == "T"
+    assert entry["summary"] == "Real summary"
+
+
+def test_iter_feed_entries_uses_content_when_no_summary():
+    rss = b"""<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/"><channel>
+      <item><title>Full</title><link>https://example.com/full</link>
+        <content:encoded>&lt;p&gt;Full body&lt;/p&gt;</content:encoded></item>
+    </channel></rss>"""
+    atom = b"""<feed xmlns="http://www.w3.org/2005/Atom">
+      <entry><title>Atom</title><link href="https://example.com/atom"/><content type="html">Atom body</content></entry>
+    </feed>"""
+    assert ReaderAgent._iter_feed_entries(rss)[0]["summary"] == "<p>Full body</p>"
+    assert ReaderAgent._iter_feed_entries(atom)[0]["summary"] == "Atom body"
+
+
+def test_iter_feed_entries_reads_rss1_and_dc_date():
+    payload = b"""<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+        xmlns="http://purl.org/rss/1.0/" xmlns:dc="http://purl.org/dc/elements/1.1/">
+      <item><title>RDF story</title><link>https://example.com/rdf</link><dc:date>2024-05-14T08:30:00Z</dc:date></item>
+    </rdf:RDF>"""
+    assert ReaderAgent._iter_feed_entries(payload) == [
+        {"title": "RDF story", "link": "https://example.com/rdf", "published": "2024-05-14T08:30:00Z"}
+    ]
+
+
+def test_fetch_feed_entries_falls_back_to_feedparser_for_unknown_formats(monkeypatch, reader_agent):
+    payload = b"""<feed version="0.3" xmlns="http://purl.org/atom/ns#">
+      <entry><title>Legacy Atom</title><link rel="alternate" href="https://example.com/old"/></entry>
+    </feed>"""
+    parsed = []
+
+    def fake_parse(data):
+        parsed.append(data)
+        return SimpleNamespace(entries=[{"title": "Legacy Atom", "link": "https://example.com/old"}])
+
+    monkeypatch.setattr("agents.reader.http_get", lambda url, timeout=20: SimpleResponse(text="", status_code=200, content=payload))
+    monkeypatch.setattr("agents.reader.feedparser", SimpleNamespace(parse=fake_parse))
+    entries = reader_agent._fetch_feed_entries("https://example.com/atom03")
+    assert parsed == [payload]
+    assert entries == [{"title": "Legacy Atom", "link": "https://example.com/old"}]
+
+
+def test_run_writes_digest_json(tmp_path, monkeypatch):
+    monkeypatch.setattr("agents.reader.DIGESTS_DIR", tmp_path)
+    monkeypatch.setattr("agents.reader.fetch_sources", lambda: [])
+    agent = ReaderAgent(target_date=date(2024, 5, 10))
+    output_path = agent.run()
+    payload = json.loads(output_path.read_text())
+    assert output_path.name == "digest_2024-05-10.json"
+    assert payload["date"] == "2024-05-10"
+    assert payload["quote"]["author"] == "Editorial Team"
+
+
+def test_fetch_article_html_skips_non_html_regardless_of_header_case(monkeypatch, reader_agent):
+    def fake_http_get(url, timeout=20):
+        content_type = "Application/PDF" if url.endswith(".pdf") else "Text/HTML; charset=utf-8"
+        return SimpleResponse(text="<html>body</html>", status_code=200, headers={"content-TYPE": content_type})
+
+    monkeypatch.setattr("agents.reader.http_get", fake_http_get)
+    assert reader_agent._fetch_article_html("https://example.com/report.pdf") is None
+    assert reader_agent._fetch_article_html("https://example.com/story") == "<html>body</html>"
@@ -19,8 +19,7 @@ def sample_source(source_id: str = "base") -> SourceMetadata:
     )
 
 
-def test_apply_feedback_adds_sources():
-    agent = ResearcherAgent()
+def test_apply_feedback_adds_sources(researcher_agent):
     responses = [
         FeedbackResponse(
             submitted_at=datetime.now(timezone.utc),
@@ -38,13 +37,12 @@ def test_apply_feedback_adds_sources():
             },
         )
     ]
-    expanded = agent.apply_feedback([sample_source()], responses)
+    expanded = researcher_agent.apply_feedback([sample_source()], responses)
     ids = {src.source_id for src in expanded}
     assert ids == {"base", "new_source"}
 
 
-def test_apply_feedback_adjusts_sources():
-    agent = ResearcherAgent()
+def test_apply_feedback_adjusts_sources(researcher_agent):
     responses = [
         FeedbackResponse(
             submitted_at=datetime.now(timezone.utc),
@@ -53,7 +51,13 @@ def test_apply_feedback_adjusts_sources():
             payload={"credibility_score": 0.95, "topics": ["business", "markets"]},
         )
     ]
-    expanded = agent.apply_feedback([sample_source()], responses)
+    expanded = researcher_agent.apply_feedback([sample_source()], responses)
     target = next(src for src in expanded if src.source_id == "base")
     assert target.credibility_score == 0.95
     assert target.topics == ["business", "markets"]
+
+
+def test_slugify_name_replaces_non_alphanumerics():
+    assert ResearcherAgent._slugify_name("a16z • AI + Business") == "a16z___ai___business"
+    assert ResearcherAgent._slugify_name("Zürich AI") == "zürich_ai"
+    assert ResearcherAgent._slugify_name("•••") == "source"
@@ -1,6 +1,9 @@
 import json
+import sqlite3
 from datetime import datetime
 
+import pytest
+
 from agents.models import SourceMetadata
 from agents import storage
 
@@ -47,3 +50,135 @@ def test_seed_db_from_catalog(tmp_path, monkeypatch):
     assert seeded[0].name == "Seeded Outlet"
     round_trip = storage.fetch_sources()
     assert round_trip[0].source_id == "seeded"
+
+
+def test_upsert_sources_updates_existing_rows(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "DB_PATH", tmp_path / "sources.db")
+    monkeypatch.setattr(storage, "CATALOG_PATH", tmp_path / "catalog.json")
+    payload = {
+        "name": "Outlet",
+        "url": "https://example.com/rss",
+        "ingestion_type": "rss",
+        "credibility_score": 0.7,
+        "topics": ["business"],
+        "cadence": "daily",
+        "visitor_score": 0.7,
+        "business_alignment": 0.7,
+    }
+    storage.upsert_sources(SourceMetadata(source_id=f"src_{idx}", **payload) for idx in range(3))
+    storage.upsert_sources([SourceMetadata(source_id="src_1", **{**payload, "name": "Renamed"})])
+    result = {src.source_id: src for src in storage.fetch_sources()}
+    assert set(result) == {"src_0", "src_1", "src_2"}
+    assert result["src_1"].name == "Renamed"
+
+
+def test_consume_feedback_responses_skips_rewrite_when_empty(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "FEEDBACK_PATH", tmp_path / "feedback.json")
+    storage.FEEDBACK_PATH.write_text(json.dumps({"last_request_iso": None, "requests": [], "responses": []}))
+    saved = []
+    monkeypatch.setattr(storage, "save_feedback", saved.append)
+    assert storage.consume_feedback_responses() == []
+    assert saved == []
+
+
+def test_consume_feedback_responses_clears_queue(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "FEEDBACK_PATH", tmp_path / "feedback.json")
+    response = {
+        "submitted_at": datetime.utcnow().isoformat(),
+        "source_id": "seeded",
+        "action": "remove",
+        "payload": {},
+    }
+    storage.FEEDBACK_PATH.write_text(json.dumps({"last_request_iso": None, "requests": [], "responses": [response]}))
+    consumed = storage.consume_feedback_responses()
+    assert [item.source_id for item in consumed] == ["seeded"]
+    assert storage.load_feedback()["responses"] == []
+
+
+def test_topics_round_trip_in_order(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "DB_PATH", tmp_path / "sources.db")
+    monkeypatch.setattr(storage, "CATALOG_PATH", tmp_path / "catalog.json")
+    sample = SourceMetadata(
+        source_id="ordered",
+        name="Ordered",
+        url="https://example.com/rss",
+        ingestion_type="rss",
+        credibility_score=0.9,
+        topics=["policy", "business", "markets", "policy"],
+        cadence="daily",
+        visitor_score=0.8,
+        business_alignment=0.85,
+    )
+    storage.upsert_sources([sample])
+    assert storage.fetch_sources()[0].topics == ["policy", "business", "markets", "policy"]
+    sample.topics = ["society"]
+    storage.upsert_sources([sample])
+    assert storage.fetch_sources()[0].topics == ["society"]
+
+
+def test_legacy_topics_column_is_migrated(tmp_path, monkeypatch):
+    db_path = tmp_path / "legacy.db"
+    monkeypatch.setattr(storage, "DB_PATH", db_path)
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE sources (
+                source_id TEXT PRIMARY KEY, name TEXT NOT NULL, url TEXT NOT NULL,
+                ingestion_type TEXT NOT NULL, credibility_score REAL, topics TEXT, cadence TEXT,
+                visitor_score REAL, business_alignment REAL, last_checked TEXT
+            )
+            """
+        )
+        conn.execute(
+            "INSERT INTO sources VALUES ('legacy', 'Legacy', 'https://example.com', 'rss', 0.8, ?, 'daily', 0.7, 0.7, NULL)",
+            (json.dumps(["markets", "business"]),),
+        )
+    conn.close()
+    monkeypatch.setattr(storage, "CATALOG_PATH", tmp_path / "catalog.json")
+    legacy = storage.fetch_sources()[0]
+    assert legacy.topics == ["markets", "business"]
+
+    legacy.topics = ["policy"]
+    storage.upsert_sources([legacy])
+    storage._CONNECTIONS.pop(db_path).close()
+    assert storage.fetch_sources()[0].topics == ["policy"]
+
+
+def test_failed_legacy_migration_rolls_back(tmp_path, monkeypatch):
+    db_path = tmp_path / "legacy.db"
+    monkeypatch.setattr(storage, "DB_PATH", db_path)
+    monkeypatch.setattr(storage, "CLEAR_LEGACY_TOPICS_SQL", "UPDATE missing_table SET topics = NULL")
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE sources (source_id TEXT PRIMARY KEY, name TEXT NOT NULL, topics TEXT)")
+        conn.execute("INSERT INTO sources VALUES ('legacy', 'Legacy', ?)", (json.dumps(["markets"]),))
+    conn.close()
+    with pytest.raises(sqlite3.OperationalError):
+        storage.ensure_schema()
+    assert db_path not in storage._CONNECTIONS
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT count(*) FROM source_topics").fetchone() == (0,)
+        assert conn.execute("SELECT topics FROM sources").fetchone() == (json.dumps(["markets"]),)
+    conn.close()
+
+
+def test_fetch_sources_falls_back_to_catalog(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "DB_PATH", tmp_path / "sources.db")
+    monkeypatch.setattr(storage, "CATALOG_PATH", tmp_path / "catalog.json")
+    storage.CATALOG_PATH.write_text(
+        json.dumps(
+            [
+                {
+                    "source_id": "catalog_only",
+                    "name": "Catalog Only",
+                    "url": "https://catalog.example.com/rss",
+                    "ingestion_type": "rss",
+                    "credibility_score": 0.8,
+                    "topics": ["business"],
+                    "cadence": "daily",
+                    "visitor_score": 0.7,
+                    "business_alignment": 0.9,
+                }
+            ]
+        )
+    )
+    assert [src.source_id for src in storage.fetch_sources()] == ["catalog_only"]
@@ -1,14 +1,46 @@
+from agents import theme_engine as theme_module
 from agents.theme_engine import ThemeEngine
 
 
-def test_theme_engine_uses_stub_when_unavailable(monkeypatch, tmp_path):
-    engine = ThemeEngine()
+def test_theme_engine_uses_stub_when_unavailable(monkeypatch, theme_engine):
+    theme_module._cached_theme.cache_clear()
 
     class DummyResponse:
         def raise_for_status(self):
             raise RuntimeError("network down")
 
     monkeypatch.setattr("agents.theme_engine.http_get", lambda *_, **__: DummyResponse())
-    theme = engine.get_theme()
+    theme = theme_engine.get_theme()
     assert "Helsinki" in theme.weather["summary"]
     assert theme.palette
+
+
+def test_get_theme_fetches_weather_once_per_hour(monkeypatch):
+    theme_module._cached_theme.cache_clear()
+    calls = []
+
+    def fake_http_get(*_, **__):
+        calls.append(1)
+        raise RuntimeError("network down")
+
+    monkeypatch.setattr("agents.theme_engine.http_get", fake_http_get)
+    monkeypatch.setattr(theme_module.time, "time", lambda: 3600 * 10 + 5)
+    first = ThemeEngine().get_theme()
+    second = ThemeEngine().get_theme()
+    monkeypatch.setattr(theme_module.time, "time", lambda: 3600 * 11 + 5)
+    ThemeEngine().get_theme()
+    assert first is second
+    assert len(calls) == 2
+
+
+def test_season_from_month_covers_every_month():
+    seasons = [ThemeEngine._season_from_month(month) for month in range(1, 13)]
+    assert seasons == ["winter"] * 2 + ["spring"] * 3 + ["summer"] * 3 + ["autumn"] * 3 + ["winter"]
+
+
+def test_classify_condition_prefers_snow_over_rain():
+    assert ThemeEngine._classify_condition("light rain and snow") == "snow"
+    assert ThemeEngine._classify_condition("patchy rain nearby") == "rain"
+    assert ThemeEngine._classify_condition("windy, rain later") == "rain"
+    assert ThemeEngine._classify_condition("strong wind") == "wind"
+    assert ThemeEngine._classify_condition("overcast") == "cloudy"